@@ -6,15 +6,30 @@ Test Collateral Jobs CLI - A specialized tool for test-collateral Jenkins jobs
 import os
 import sys
 import click
-import jenkins
 import time
 import re
-import subprocess
-import requests
 import json
+import atexit
+import functools
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime, timedelta
+from urllib.parse import quote, urlencode
 from dotenv import load_dotenv
-from tabulate import tabulate
+
+# Use orjson for cache files when available (much faster parse/dump), else stdlib json
+try:
+    import orjson
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+    
+    _json_loads = json.loads
 
 # Load environment variables from .env file
 load_dotenv()
@@ -23,14 +38,56 @@ load_dotenv()
 JENKINS_URL = os.getenv("JENKINS_URL")
 JENKINS_USER = os.getenv("JENKINS_USER")
 JENKINS_TOKEN = os.getenv("JENKINS_TOKEN")
+JENKINS_AUTH = (JENKINS_USER, JENKINS_TOKEN)
 
 # Base folder for all jobs
 BASE_FOLDER = "test-collateral"
 
+# Job status by ball color; running jobs report the same colors with an "_anime" suffix
+_BASE_STATUS_MAP = {
+    'blue': 'Success',
+    'green': 'Success',
+    'red': 'Failed',
+    'yellow': 'Unstable',
+    'grey': 'Not Built',
+    'disabled': 'Disabled',
+    'aborted': 'Aborted',
+    'notbuilt': 'Not Built'
+}
+_STATUS_MAP = dict(_BASE_STATUS_MAP)
+_STATUS_MAP.update({f"{color}_anime": f"{status} (Running)" for color, status in _BASE_STATUS_MAP.items()})
+
+# Number of concurrent requests used when fetching detailed job status
+JOB_STATUS_WORKERS = 16
+
+# Jenkins clients already connected in this process, keyed by (url, user)
+_jenkins_clients = {}
+
+# (connect, read) timeouts in seconds for direct HTTP requests to Jenkins
+HTTP_TIMEOUT = (5, 30)
+
 # Cache settings
 CACHE_DURATION_MINUTES = 1440  # Cache jobs for 24 hours (1440 minutes)
 CACHE_FILE = os.path.expanduser("~/.jenkins_cli_cache.json")
+CACHE_META_FILE = CACHE_FILE + ".meta"  # Timestamp and job count, so cache --info needn't parse the jobs
 BRANCH_CACHE_FILE = os.path.expanduser("~/.jenkins_cli_branch_cache.json")
+# Parameter definitions per job path, stored with the ETag/Last-Modified they were fetched with
+PARAMS_CACHE_FILE = os.path.expanduser("~/.jenkins_cli_params_cache.json")
+BRANCH_CACHE_SIZE = 50  # Keep only the last 50 branches to prevent cache from growing too large
+
+# In-memory copy of the job cache ({'timestamp': epoch seconds, 'jobs': [...]}) for this process
+_jobs_mem_cache = None
+
+# (jobs list, [(lowercased name, job), ...], {lowercased name: job}, [(lowercased name, build job), ...])
+# for the jobs list last indexed
+_jobs_index = None
+
+# In-memory branch cache, loaded from disk on first use and written back at exit
+_branch_cache = None
+_branch_set = set()  # Membership index kept in sync with _branch_cache
+_branch_by_lower = None  # Lowercased name -> most recent cached branch, rebuilt after changes
+_branch_candidates = None  # Searchable cached + git branch list for find_matching_branch, rebuilt after changes
+_branch_cache_dirty = False
 
 # Available services list - loaded from environment variable only
 services_env = os.getenv("AVAILABLE_SERVICES")
@@ -39,8 +96,43 @@ if services_env:
 else:
     AVAILABLE_SERVICES = []
 
+# Minimum similarity score (0-100) for suggesting a service that doesn't contain the partial name
+FUZZY_SUGGESTION_CUTOFF = 60
+
+# Lowercased service names, computed once so matching doesn't re-lower on every lookup
+_AVAILABLE_SERVICES_LOWER = tuple(s.lower() for s in AVAILABLE_SERVICES)
+
+# Lowercased name -> service for O(1) exact matches (first occurrence wins, as in a scan)
+_SERVICES_BY_LOWER = {
+    service_lower: service
+    for service, service_lower in reversed(list(zip(AVAILABLE_SERVICES, _AVAILABLE_SERVICES_LOWER)))
+}
+
+# Service -> specificity rank (longest first, ties in AVAILABLE_SERVICES order)
+_SERVICE_RANK = {
+    service: rank
+    for rank, service in enumerate(sorted(dict.fromkeys(AVAILABLE_SERVICES), key=len, reverse=True))
+}
+
+# Finds every service occurring in a job name in one pass: the lookahead lets matches
+# overlap, and longest-first alternatives give the longest service at each position
+_SERVICE_RE = re.compile(
+    "(?=(%s))" % "|".join(re.escape(service) for service in _SERVICE_RANK)
+) if _SERVICE_RANK else None
+
+def _create_http_adapter():
+    """Create a pooled HTTP adapter that retries transient gateway errors"""
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    return HTTPAdapter(
+        pool_connections=JOB_STATUS_WORKERS,
+        pool_maxsize=JOB_STATUS_WORKERS * 2,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    )
+
 def get_jenkins_client():
-    """Create and return a Jenkins client instance"""
+    """Create and return a Jenkins client instance (reused within a process)"""
     if not all([JENKINS_URL, JENKINS_USER, JENKINS_TOKEN]):
         click.echo("Error: Jenkins connection details not found.")
         click.echo("Please create a .env file with JENKINS_URL, JENKINS_USER, and JENKINS_TOKEN.")
@@ -50,10 +142,22 @@ def get_jenkins_client():
         click.echo("JENKINS_TOKEN=your-api-token")
         sys.exit(1)
     
+    client_key = (JENKINS_URL, JENKINS_USER)
+    if client_key in _jenkins_clients:
+        return _jenkins_clients[client_key]
+    
+    # Imported here so commands that never talk to Jenkins start faster
+    import jenkins
+    
     try:
         server = jenkins.Jenkins(JENKINS_URL, username=JENKINS_USER, password=JENKINS_TOKEN)
+        # Keep connections alive across calls and size the pool for concurrent fetches
+        pooled_adapter = _create_http_adapter()
+        server._session.mount('http://', pooled_adapter)
+        server._session.mount('https://', pooled_adapter)
         # Test connection
         server.get_whoami()
+        _jenkins_clients[client_key] = server
         return server
     except jenkins.JenkinsException as e:
         click.echo(f"Error connecting to Jenkins: {e}")
@@ -63,37 +167,106 @@ def get_jenkins_client():
         click.echo(f"Error connecting to Jenkins: {e}")
         sys.exit(1)
 
+def _read_json_file(path):
+    """Read and parse a JSON cache file"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+def _write_json_file(path, data):
+    """Serialize data to a JSON cache file
+    
+    Writes to a temporary file and renames it into place, so an interrupted
+    write never leaves a truncated cache behind.
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _index_jobs(jobs):
+    """Add precomputed lookup fields ('_name_lower', '_is_build') to each job in place"""
+    for job in jobs:
+        if '_name_lower' not in job:
+            name_lower = job['name'].lower()
+            job['_name_lower'] = name_lower
+            job['_is_build'] = 'build' in name_lower and not name_lower.endswith('-report')
+    return jobs
+
+def _tabulate(*args, **kwargs):
+    """Format a table with tabulate, importing it only when a table is printed"""
+    from tabulate import tabulate
+    return tabulate(*args, **kwargs)
+
+def get_http_session():
+    """Get the pooled HTTP session for direct Jenkins API requests
+    
+    This is the Jenkins client's own session, so direct requests share its
+    keep-alive connections, retry policy and SSL settings.
+    """
+    return get_jenkins_client()._session
+
 def load_jobs_cache():
     """Load jobs from cache file if valid"""
-    try:
-        if not os.path.exists(CACHE_FILE):
+    global _jobs_mem_cache
+    # Serve from memory if this process already loaded or saved the cache
+    if _jobs_mem_cache is not None:
+        if time.time() - _jobs_mem_cache['timestamp'] > CACHE_DURATION_MINUTES * 60:
             return None
+        return _jobs_mem_cache['jobs']
+    
+    # The file's mtime is the save time, so an expired cache is rejected without reading it
+    try:
+        cache_mtime = os.path.getmtime(CACHE_FILE)
+    except OSError:
+        return None
+    if time.time() - cache_mtime > CACHE_DURATION_MINUTES * 60:
+        return None
+    
+    try:
+        cache_data = _read_json_file(CACHE_FILE)
         
-        with open(CACHE_FILE, 'r') as f:
-            cache_data = json.load(f)
-        
-        # Check if cache is still valid
-        cache_time = datetime.fromisoformat(cache_data['timestamp'])
-        if datetime.now() - cache_time > timedelta(minutes=CACHE_DURATION_MINUTES):
+        # Check if cache is still valid (timestamp is stored as epoch seconds)
+        cache_time = cache_data['timestamp']
+        if time.time() - cache_time > CACHE_DURATION_MINUTES * 60:
             return None
         
-        return cache_data['jobs']
-    except (json.JSONDecodeError, KeyError, ValueError):
+        # Caches written before the lookup fields existed get them computed here
+        jobs = _index_jobs(cache_data['jobs'])
+        _jobs_mem_cache = {'timestamp': cache_time, 'jobs': jobs}
+        return jobs
+    except (OSError, json.JSONDecodeError, KeyError, ValueError, TypeError):
+        # TypeError covers caches written with the old ISO timestamp format
         return None
 
 def save_jobs_cache(jobs):
     """Save jobs to cache file"""
+    global _jobs_mem_cache
+    _index_jobs(jobs)
+    now = time.time()
+    _jobs_mem_cache = {'timestamp': now, 'jobs': jobs}
     try:
         cache_data = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now,
             'jobs': jobs
         }
-        with open(CACHE_FILE, 'w') as f:
-            json.dump(cache_data, f)
+        _write_json_file(CACHE_FILE, cache_data)
+        _write_json_file(CACHE_META_FILE, {'timestamp': now, 'count': len(jobs)})
     except Exception:
         # Ignore cache save errors
         pass
 
+def _reset_jobs_cache():
+    """Drop the in-memory copy of the job cache"""
+    global _jobs_mem_cache
+    _jobs_mem_cache = None
+
 def get_jobs(force_refresh=False):
     """Get jobs from cache or Jenkins API"""
     if not force_refresh:
@@ -116,14 +289,59 @@ def get_jobs(force_refresh=False):
         click.echo(f"Error fetching jobs from Jenkins: {e}")
         return []
 
+def get_jobs_index(force_refresh=False):
+    """Get jobs as (lowercased name, job) pairs, built once per jobs list"""
+    global _jobs_index
+    jobs = get_jobs(force_refresh)
+    if _jobs_index is None or _jobs_index[0] is not jobs:
+        jobs_by_name = {}
+        for job in jobs:
+            jobs_by_name.setdefault(job['_name_lower'], job)
+        pairs = [(job['_name_lower'], job) for job in jobs]
+        build_pairs = [(name_lower, job) for name_lower, job in pairs if job['_is_build']]
+        _jobs_index = (jobs, pairs, jobs_by_name, build_pairs)
+    return _jobs_index[1]
+
+def get_build_jobs_index(force_refresh=False):
+    """Get build jobs as (lowercased name, job) pairs, filtered once per jobs list"""
+    get_jobs_index(force_refresh)
+    return _jobs_index[3]
+
+def get_job_by_name(name_lower, force_refresh=False):
+    """Look up a job by its full lowercased name with one dict lookup (None if there is none)"""
+    get_jobs_index(force_refresh)
+    return _jobs_index[2].get(name_lower)
+
+def match_jobs(search_name, jobs_index, preferred_prefix=None):
+    """Bucket jobs whose lowercased name contains search_name, in a single pass
+    
+    Returns four lists in priority order: exact matches, names starting with
+    preferred_prefix + search_name (only if a prefix is given), names starting
+    with search_name, and any other name containing search_name.
+    """
+    buckets = ([], [], [], [])
+    preferred = preferred_prefix + search_name if preferred_prefix else None
+    for name_lower, job in jobs_index:
+        # One find() answers both "contains" and "starts with"
+        idx = name_lower.find(search_name)
+        if idx < 0:
+            continue
+        if name_lower == search_name:
+            bucket = 0
+        elif preferred and name_lower.startswith(preferred):
+            bucket = 1
+        else:
+            bucket = 2 if idx == 0 else 3
+        buckets[bucket].append(job)
+    return buckets
+
 def load_branch_cache():
     """Load branch names from cache file"""
     try:
         if not os.path.exists(BRANCH_CACHE_FILE):
             return []
         
-        with open(BRANCH_CACHE_FILE, 'r') as f:
-            cache_data = json.load(f)
+        cache_data = _read_json_file(BRANCH_CACHE_FILE)
         
         return cache_data.get('branches', [])
     except (json.JSONDecodeError, KeyError, ValueError):
@@ -135,34 +353,77 @@ def save_branch_cache(branches):
         cache_data = {
             'branches': branches
         }
-        with open(BRANCH_CACHE_FILE, 'w') as f:
-            json.dump(cache_data, f)
+        _write_json_file(BRANCH_CACHE_FILE, cache_data)
     except Exception:
         # Ignore cache save errors
         pass
 
+def _load_branch_cache_once():
+    """Load the branch cache into memory on first access"""
+    global _branch_cache, _branch_set
+    if _branch_cache is None:
+        # dict.fromkeys drops duplicates so the set and deque stay in step
+        _branch_cache = deque(dict.fromkeys(load_branch_cache()), maxlen=BRANCH_CACHE_SIZE)
+        _branch_set = set(_branch_cache)
+    return _branch_cache
+
+def _flush_branch_cache():
+    """Write the in-memory branch cache back to disk if it was modified"""
+    global _branch_cache_dirty
+    if _branch_cache_dirty and _branch_cache is not None:
+        save_branch_cache(list(_branch_cache))
+        _branch_cache_dirty = False
+
+def _reset_branch_cache():
+    """Drop the in-memory branch cache without writing it back"""
+    global _branch_cache, _branch_set, _branch_by_lower, _branch_candidates, _branch_cache_dirty
+    _branch_cache = None
+    _branch_set = set()
+    _branch_by_lower = None
+    _branch_candidates = None
+    _branch_cache_dirty = False
+    find_matching_branch.cache_clear()
+
+atexit.register(_flush_branch_cache)
+
 def add_branch_to_cache(branch_name):
     """Add a branch name to the cache (excluding 'dev')"""
+    global _branch_by_lower, _branch_candidates, _branch_cache_dirty
     if branch_name.lower() == 'dev':
         return
     
-    cached_branches = load_branch_cache()
+    cached_branches = _load_branch_cache_once()
     
     # Remove the branch if it already exists (to move it to the front)
-    if branch_name in cached_branches:
+    if branch_name in _branch_set:
+        if cached_branches[0] == branch_name:
+            return
         cached_branches.remove(branch_name)
+    elif len(cached_branches) == cached_branches.maxlen:
+        # appendleft will push out the oldest branch, keep the index in step
+        _branch_set.discard(cached_branches[-1])
     
     # Add to the beginning of the list (most recent first)
-    cached_branches.insert(0, branch_name)
-    
-    # Keep only the last 50 branches to prevent cache from growing too large
-    cached_branches = cached_branches[:50]
-    
-    save_branch_cache(cached_branches)
+    cached_branches.appendleft(branch_name)
+    _branch_set.add(branch_name)
+    _branch_by_lower = None
+    _branch_candidates = None
+    _branch_cache_dirty = True
+    # Branch matches depend on the cache order
+    find_matching_branch.cache_clear()
+
+def _get_branch_by_lower():
+    """Get the lowercase lookup index for cached branches, building it if needed"""
+    global _branch_by_lower
+    if _branch_by_lower is None:
+        _branch_by_lower = {}
+        for branch in _load_branch_cache_once():
+            _branch_by_lower.setdefault(branch.lower(), branch)
+    return _branch_by_lower
 
 def get_cached_branches():
     """Get cached branch names for autocompletion"""
-    return load_branch_cache()
+    return list(_load_branch_cache_once())
 
 def is_folder(job_info):
     """Check if a job is actually a folder"""
@@ -172,6 +433,10 @@ def get_job_path(job_name):
     """Get the full path to a job in the test-collateral folder"""
     return f"{BASE_FOLDER}/{job_name}"
 
+def get_job_url(job_path):
+    """Get the full Jenkins URL for a job path like 'test-collateral/my-job'"""
+    return f"{JENKINS_URL}/job/{job_path.replace('/', '/job/')}"
+
 def job_exists(server, job_name):
     """Check if a job exists in the test-collateral folder"""
     job_path = get_job_path(job_name)
@@ -182,81 +447,287 @@ def get_job_info(server, job_name):
     job_path = get_job_path(job_name)
     return server.get_job_info(job_path)
 
-def wait_for_build_to_finish(server, job_name, build_number, timeout=300, poll_interval=5):
-    """Wait for a build to finish and return the result"""
+def get_job_tree(job_path, tree, build_number=None):
+    """Fetch only the given `tree` fields of a job's (or one of its builds') JSON API
+    
+    Jenkins' full job JSON includes every build, health report and action;
+    asking for just the fields we read keeps responses to a few bytes.
+    """
+    url = get_job_url(job_path)
+    if build_number is not None:
+        url = f"{url}/{build_number}"
+    response = get_http_session().get(f"{url}/api/json", params={'tree': tree}, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+# Only the parameter definition fields job_params shows
+_PARAMS_TREE = 'property[parameterDefinitions[name,type,description,choices,defaultParameterValue[value]]]'
+
+def _parse_param_definitions(job_info):
+    """Flatten a job's parameter definitions into [name, type, default, description, choices] rows"""
+    param_defs = [
+        param_def
+        for prop in job_info.get('property') or []
+        if prop.get('_class', '').endswith('ParametersDefinitionProperty')
+        for param_def in prop.get('parameterDefinitions', [])
+    ]
+    rows = [
+        [
+            param_def.get('name'),
+            param_def.get('type', 'Unknown'),
+            (param_def.get('defaultParameterValue') or {}).get('value', 'None'),
+            param_def.get('description', 'No description'),
+            param_def.get('choices') or [],
+        ]
+        for param_def in param_defs
+    ]
+    return rows
+
+def get_job_parameters(job_path):
+    """Get a job's parameter definition rows, revalidating the cached copy with Jenkins
+    
+    The cached rows are sent back with If-None-Match/If-Modified-Since, so an
+    unchanged job costs a 304 response instead of a download and re-parse.
+    """
+    try:
+        params_cache = _read_json_file(PARAMS_CACHE_FILE)
+    except (OSError, ValueError):
+        params_cache = {}
+    
+    cached = params_cache.get(job_path)
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    
+    response = get_http_session().get(f"{get_job_url(job_path)}/api/json", params={'tree': _PARAMS_TREE},
+                                      headers=headers, timeout=HTTP_TIMEOUT)
+    if response.status_code == 304 and cached:
+        return cached['params']
+    response.raise_for_status()
+    rows = _parse_param_definitions(response.json())
+    
+    # Without a validator there is nothing to revalidate against next time
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        params_cache[job_path] = {'etag': etag, 'last_modified': last_modified, 'params': rows}
+        try:
+            _write_json_file(PARAMS_CACHE_FILE, params_cache)
+        except Exception:
+            # Ignore cache save errors
+            pass
+    return rows
+
+def get_job_status(server, job_name):
+    """Get a display status for a job from its last build"""
     job_path = get_job_path(job_name)
+    try:
+        # One small request covers both the folder check and the last build's state
+        job_info = get_job_tree(job_path, '_class,lastBuild[number,building,result]')
+        if is_folder(job_info):
+            return "Folder"
+        
+        last_build = job_info.get('lastBuild')
+        if not last_build:
+            return "Not Built"
+        if last_build.get('building'):
+            return "Building"
+        return last_build.get('result', 'Unknown')
+    except Exception:
+        return "Error"
+
+def get_queue_id(location):
+    """Get the queue item ID from the Location header of a build trigger response"""
+    if not location:
+        return None
+    queue_id = location.rstrip('/').rsplit('/', 1)[-1]
+    return int(queue_id) if queue_id.isdigit() else None
+
+def get_queue_item(queue_id):
+    """Fetch a queue item's started build (executable) and cancelled flag"""
+    queue_url = f"{JENKINS_URL}/queue/item/{int(queue_id)}/api/json"
+    response = get_http_session().get(queue_url, params={'tree': 'executable[number],cancelled'},
+                                      timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+def wait_for_queued_build(queue_id, timeout=30, poll_interval=10, initial_interval=0.25):
+    """Wait for a queued item to start and return its build number (None if it doesn't)
+    
+    The queue item gets its build number exactly when the build starts, so
+    there is no guessing from the job's last build. Polls with backoff,
+    starting at initial_interval and growing 1.5x up to poll_interval.
+    """
     start_time = time.time()
+    interval = initial_interval
     
     while time.time() - start_time < timeout:
         try:
-            build_info = server.get_build_info(job_path, build_number)
+            queue_item = get_queue_item(queue_id)
+            if queue_item.get('executable'):
+                return queue_item['executable'].get('number')
+            if queue_item.get('cancelled'):
+                return None
+        except Exception as e:
+            click.echo(f"Error checking queue item: {e}")
+        time.sleep(interval)
+        interval = min(interval * 1.5, poll_interval)
+    
+    return None
+
+def wait_for_build_to_finish(server, job_name, build_number, timeout=300, poll_interval=5, initial_interval=0.5):
+    """Wait for a build to finish and return the result
+    
+    Polls with exponential backoff, starting at initial_interval and doubling
+    up to poll_interval, so short builds are noticed quickly without hammering
+    Jenkins during long ones.
+    """
+    job_path = get_job_path(job_name)
+    start_time = time.time()
+    interval = initial_interval
+    
+    while time.time() - start_time < timeout:
+        try:
+            build_info = get_job_tree(job_path, 'building,result', build_number)
             if not build_info.get('building'):
                 return build_info.get('result')
             click.echo(f"Build #{build_number} is still running... (elapsed: {int(time.time() - start_time)}s)")
-            time.sleep(poll_interval)
         except Exception as e:
             click.echo(f"Error checking build status: {e}")
-            time.sleep(poll_interval)
+        time.sleep(interval)
+        interval = min(interval * 2, poll_interval)
     
     click.echo(f"Timeout reached ({timeout}s). Build is still running.")
     return "TIMEOUT"
 
-def find_matching_service(partial_name, available_services):
-    """Find a service name that matches the partial name provided"""
-    if not partial_name or not available_services:
-        return None
+def _best_match(partial_lower, candidates, candidates_lower):
+    """Return the best candidate for a lowercased partial name in a single pass
     
-    # Case 1: Exact match
-    for service in available_services:
-        if service.lower() == partial_name.lower():
-            return service
+    Priority: exact match, then the first candidate starting with the partial
+    name, then the shortest candidate containing it. Returns None if nothing
+    matches.
+    """
+    prefix_match = None
+    contains_match = None
+    for candidate, candidate_lower in zip(candidates, candidates_lower):
+        if partial_lower not in candidate_lower:
+            continue
+        
+        if candidate_lower == partial_lower:
+            return candidate
+        
+        if prefix_match is None and candidate_lower.startswith(partial_lower):
+            prefix_match = candidate
+        
+        if contains_match is None or len(candidate) < len(contains_match):
+            contains_match = candidate
     
-    # Case 2: Service contains the partial name
-    matches = []
-    for service in available_services:
-        if partial_name.lower() in service.lower():
-            matches.append(service)
+    return prefix_match or contains_match
+
+def find_matching_service(partial_name, available_services):
+    """Find a service name that matches the partial name provided
     
-    # If we found exactly one match, return it
-    if len(matches) == 1:
-        return matches[0]
+    Typos are deliberately not auto-corrected, since scale and deploy act on the
+    matched service without asking; callers offer get_service_suggestions instead.
+    """
+    if not partial_name or not available_services:
+        return None
     
-    # If we found multiple matches, return the one that starts with the partial name
-    for match in matches:
-        if match.lower().startswith(partial_name.lower()):
-            return match
+    if available_services is AVAILABLE_SERVICES:
+        return _find_available_service(partial_name)
     
-    # If we still have multiple matches, return the shortest one
-    if matches:
-        return min(matches, key=len)
+    services_lower = [service.lower() for service in available_services]
+    return _best_match(partial_name.lower(), available_services, services_lower)
+
+@functools.lru_cache(maxsize=256)
+def _find_available_service(partial_name):
+    """Find the AVAILABLE_SERVICES entry matching a partial name, memoized per name"""
+    # Fast path: full service names resolve with a single dict lookup
+    exact_match = _SERVICES_BY_LOWER.get(partial_name.lower())
+    if exact_match:
+        return exact_match
+    return _best_match(partial_name.lower(), AVAILABLE_SERVICES, _AVAILABLE_SERVICES_LOWER)
+
+@functools.lru_cache(maxsize=1)
+def _get_rapidfuzz():
+    """Import rapidfuzz on first use, since only typo-tolerant suggestions need it
     
-    # No match found
-    return None
+    Returns (process, scorer, processor), or None if rapidfuzz isn't installed.
+    """
+    try:
+        from rapidfuzz import fuzz, process, utils
+    except ImportError:
+        return None
+    return process, fuzz.WRatio, utils.default_process
 
+@functools.lru_cache(maxsize=256)
 def get_service_suggestions(partial_name, max_suggestions=10):
-    """Get service name suggestions based on partial input"""
+    """Get service name suggestions based on partial input
+    
+    Results are memoized per partial name and returned as a tuple.
+    """
     if not partial_name:
-        return AVAILABLE_SERVICES[:max_suggestions]
+        return tuple(AVAILABLE_SERVICES[:max_suggestions])
     
     partial_lower = partial_name.lower()
-    matches = []
     
-    # First, find exact matches
-    for service in AVAILABLE_SERVICES:
-        if service.lower() == partial_lower:
-            matches.append(service)
+    # Rank every service in one pass: 0=exact, 1=starts with, 2=contains
+    ranked = []
+    seen = set()
+    for service, service_lower in zip(AVAILABLE_SERVICES, _AVAILABLE_SERVICES_LOWER):
+        if service in seen:
+            continue
+        if service_lower == partial_lower:
+            tier = 0
+        elif service_lower.startswith(partial_lower):
+            tier = 1
+        elif partial_lower in service_lower:
+            tier = 2
+        else:
+            continue
+        seen.add(service)
+        ranked.append((tier, service))
+    
+    # sorted() is stable, so services keep their original order within a tier
+    ranked.sort(key=lambda item: item[0])
+    suggestions = tuple(service for _, service in ranked[:max_suggestions])
+    
+    # Nothing contains the partial name - fall back to typo-tolerant suggestions
+    if not suggestions:
+        rapidfuzz = _get_rapidfuzz()
+        if rapidfuzz is not None:
+            fuzzy_process, scorer, processor = rapidfuzz
+            results = fuzzy_process.extract(partial_name, AVAILABLE_SERVICES, scorer=scorer,
+                                            processor=processor, score_cutoff=FUZZY_SUGGESTION_CUTOFF,
+                                            limit=max_suggestions)
+            suggestions = tuple(dict.fromkeys(service for service, _, _ in results))
+        else:
+            # Without rapidfuzz, the standard library's difflib gives similar suggestions
+            import difflib
+            close_matches = difflib.get_close_matches(partial_lower, _SERVICES_BY_LOWER, n=max_suggestions,
+                                                      cutoff=FUZZY_SUGGESTION_CUTOFF / 100)
+            suggestions = tuple(_SERVICES_BY_LOWER[service_lower] for service_lower in close_matches)
     
-    # Then, find services that start with the partial name
-    for service in AVAILABLE_SERVICES:
-        if service.lower().startswith(partial_lower) and service not in matches:
-            matches.append(service)
+    return suggestions
+
+def extract_service_name(job_name):
+    """Extract the service name from a build job name
     
-    # Finally, find services that contain the partial name
-    for service in AVAILABLE_SERVICES:
-        if partial_lower in service.lower() and service not in matches:
-            matches.append(service)
+    Job name format: test-collateral-{service}-build. The longest service from
+    AVAILABLE_SERVICES found in the name wins (the most specific one); otherwise
+    the prefix and '-build' suffix are stripped from the name.
+    """
+    if _SERVICE_RE is not None:
+        matched_services = [match.group(1) for match in _SERVICE_RE.finditer(job_name)]
+        if matched_services:
+            return min(matched_services, key=_SERVICE_RANK.__getitem__)
     
-    return matches[:max_suggestions]
+    if job_name.startswith('test-collateral-'):
+        return job_name.replace('test-collateral-', '').replace('-build', '')
+    return job_name
 
 def get_available_services(server, job_info):
     """Get available services from job parameters"""
@@ -276,105 +747,160 @@ def get_available_services(server, job_info):
         pass
     return valid_services
 
+def _find_git_dir(start_dir=None):
+    """Find the .git directory for the repository containing start_dir (or CWD)"""
+    path = os.path.abspath(start_dir or os.getcwd())
+    while True:
+        git_path = os.path.join(path, '.git')
+        if os.path.isdir(git_path):
+            return git_path
+        if os.path.isfile(git_path):
+            # Worktrees and submodules use a ".git" file pointing at the real git dir
+            with open(git_path, 'r') as f:
+                content = f.read().strip()
+            if content.startswith('gitdir:'):
+                return os.path.normpath(os.path.join(path, content[len('gitdir:'):].strip()))
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+def _read_git_refs(git_dir):
+    """Read local and origin branch names from loose refs and packed-refs"""
+    # Worktrees keep shared refs in the common dir
+    commondir_file = os.path.join(git_dir, 'commondir')
+    if os.path.isfile(commondir_file):
+        with open(commondir_file, 'r') as f:
+            git_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+    
+    ref_prefixes = ('refs/heads/', 'refs/remotes/origin/')
+    refs = set()
+    
+    # Packed refs: "<sha> <refname>" lines, plus comments and "^<sha>" peeled lines
+    packed_refs_file = os.path.join(git_dir, 'packed-refs')
+    if os.path.isfile(packed_refs_file):
+        with open(packed_refs_file, 'r') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[1].startswith(ref_prefixes):
+                    refs.add(parts[1])
+    
+    # Loose refs: one file per ref, nested directories for names containing '/'
+    for prefix in ref_prefixes:
+        ref_dir = os.path.join(git_dir, prefix)
+        for root, _, files in os.walk(ref_dir):
+            for file_name in files:
+                ref_path = os.path.join(root, file_name)
+                refs.add(prefix + os.path.relpath(ref_path, ref_dir).replace(os.sep, '/'))
+    
+    # Local branches first, then origin branches, each sorted like `git branch -a`
+    local_branches = sorted(ref[len('refs/heads/'):] for ref in refs if ref.startswith('refs/heads/'))
+    origin_branches = sorted(ref[len('refs/remotes/origin/'):] for ref in refs
+                             if ref.startswith('refs/remotes/origin/'))
+    return [branch for branch in dict.fromkeys(local_branches + origin_branches) if branch != 'HEAD']
+
+@functools.lru_cache(maxsize=1)
 def get_available_branches(service_name=None):
     """Get available git branches for a service
     
-    This function attempts to get branch information using git commands.
-    If git is not available or we're not in a git repository, it returns
-    a default list of common branches.
+    This function reads branch names directly from the refs of the git
+    repository containing the current directory. If we're not in a git
+    repository, it returns a default list of common branches. The result is
+    cached for the lifetime of the process; callers must not modify it.
     """
-    # Default common branches to return if git command fails
+    # Default common branches to return if no git branches are found
     default_branches = ['dev', 'main', 'master', 'develop', 'release']
     
     try:
-        # Try to get branches from git
-        cmd = ['git', 'branch', '-a']
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=2)
-        
-        if result.returncode == 0:
-            # Parse the output to get branch names
-            branches = []
-            for line in result.stdout.splitlines():
-                # Clean up the branch name
-                branch = line.strip()
-                if branch.startswith('*'):
-                    branch = branch[1:].strip()  # Remove the asterisk for current branch
-                if branch.startswith('remotes/origin/'):
-                    branch = branch[len('remotes/origin/'):].strip()
-                if branch and branch not in branches and not branch.endswith('/HEAD'):
-                    branches.append(branch)
+        git_dir = _find_git_dir()
+        if git_dir:
+            branches = _read_git_refs(git_dir)
             
             # If we found branches, return them
             if branches:
                 return branches
-    except (subprocess.SubprocessError, FileNotFoundError, TimeoutError):
-        # If git command fails, fall back to default branches
+    except OSError:
+        # If the refs can't be read, fall back to default branches
         pass
     
-    # Return default branches if git command failed or returned no branches
+    # Return default branches if we're not in a git repository or found no branches
     return default_branches
 
+def _get_branch_candidates():
+    """Get the branches find_matching_branch searches, building the search index if needed
+    
+    Returns (branches, cached_count, names, starts): cached branches (most recent
+    first) followed by git branches not already cached, how many of them came
+    from the cache, their lowercased names joined by newlines, and the offset at
+    which each name starts in that string.
+    """
+    global _branch_candidates
+    if _branch_candidates is None:
+        cached_branches = get_cached_branches()
+        candidates = dict.fromkeys(cached_branches)
+        candidates.update(dict.fromkeys(get_available_branches()))
+        branches = list(candidates)
+        names_lower = [branch.lower() for branch in branches]
+        
+        starts = []
+        offset = 0
+        for name_lower in names_lower:
+            starts.append(offset)
+            offset += len(name_lower) + 1
+        _branch_candidates = (branches, len(cached_branches), "\n".join(names_lower), starts)
+    return _branch_candidates
+
+@functools.lru_cache(maxsize=256)
 def find_matching_branch(partial_name):
-    """Find a branch that matches the partial name provided"""
-    # First check cached branches (most recent first)
-    cached_branches = get_cached_branches()
+    """Find a branch that matches the partial name provided
     
+    Results are memoized per partial name until the branch cache changes.
+    """
     if not partial_name:
         return 'dev'  # Default branch
     
-    # Case 1: Exact match in cached branches
-    for branch in cached_branches:
-        if branch.lower() == partial_name.lower():
-            return branch
-    
-    # Case 2: Cached branch contains the partial name
-    matches = []
-    for branch in cached_branches:
-        if partial_name.lower() in branch.lower():
-            matches.append(branch)
-    
-    # If we found exactly one match in cache, return it
-    if len(matches) == 1:
-        return matches[0]
-    
-    # If we found multiple matches in cache, return the one that starts with the partial name
-    for match in matches:
-        if match.lower().startswith(partial_name.lower()):
-            return match
-    
-    # If we still have multiple matches in cache, return the first one (most recent)
-    if matches:
-        return matches[0]
-    
-    # Fall back to git branches if no cache matches
-    available_branches = get_available_branches()
-    
-    # Case 3: Exact match in git branches
-    for branch in available_branches:
-        if branch.lower() == partial_name.lower():
-            return branch
-    
-    # Case 4: Git branch contains the partial name
-    matches = []
-    for branch in available_branches:
-        if partial_name.lower() in branch.lower():
-            matches.append(branch)
-    
-    # If we found exactly one match in git, return it
-    if len(matches) == 1:
-        return matches[0]
-    
-    # If we found multiple matches in git, return the one that starts with the partial name
-    for match in matches:
-        if match.lower().startswith(partial_name.lower()):
-            return match
+    partial_lower = partial_name.lower()
     
-    # If we still have multiple matches in git, return the shortest one
-    if matches:
-        return min(matches, key=len)
+    # Fast path: full cached branch names resolve with a single dict lookup
+    exact_match = _get_branch_by_lower().get(partial_lower)
+    if exact_match:
+        return exact_match
+    
+    best_match = partial_name  # No match found, return the partial name as is
+    if "\n" in partial_lower:
+        # Branch names never contain newlines, and one would match across names below
+        return best_match
+    
+    # Search all lowercased names at once with str.find, visiting only the branches
+    # that contain the partial name. Matches are ranked by (source, tier, tie-break):
+    # any cached match beats a git match; tiers are exact, starts with, contains;
+    # within a tier the earliest branch wins, except git "contains" matches where
+    # the shortest wins
+    branches, cached_count, names, starts = _get_branch_candidates()
+    best_rank = None
+    pos = names.find(partial_lower)
+    while pos >= 0:
+        index = bisect_right(starts, pos) - 1
+        branch = branches[index]
+        # The name ends just before the next name's start (or at the end of the string)
+        name_end = starts[index + 1] - 1 if index + 1 < len(starts) else len(names)
+        
+        from_git = index >= cached_count
+        if pos > starts[index]:
+            tier = 2
+        elif pos + len(partial_lower) == name_end:
+            tier = 0
+        else:
+            tier = 1
+        rank = (from_git, tier, len(branch) if from_git and tier == 2 else 0)
+        
+        if best_rank is None or rank < best_rank:
+            best_match, best_rank = branch, rank
+        
+        # Continue from the start of the next branch name
+        pos = names.find(partial_lower, name_end + 1)
     
-    # No match found, return the partial name as is
-    return partial_name
+    return best_match
 
 @click.group()
 def cli():
@@ -399,16 +925,9 @@ def jobs(all, type, fast, refresh):
         # Filter jobs by type first to reduce processing
         filtered_jobs = []
         for job in jobs:
-            name = job['name']
-            
-            # Filter by job type if specified
-            if type:
-                if type == 'scale' and 'scale' not in name.lower():
-                    continue
-                if type == 'build' and 'build' not in name.lower():
-                    continue
-                if type == 'deploy' and 'deploy' not in name.lower():
-                    continue
+            # Filter by job type if specified (each type name is also its keyword)
+            if type and type not in job['_name_lower']:
+                continue
             
             filtered_jobs.append(job)
         
@@ -430,66 +949,21 @@ def jobs(all, type, fast, refresh):
                         job_data.append([name, "Folder"])
                     continue
                 
-                # Basic status from color
-                status_map = {
-                    'blue': 'Success',
-                    'green': 'Success',
-                    'red': 'Failed',
-                    'yellow': 'Unstable',
-                    'grey': 'Not Built',
-                    'disabled': 'Disabled',
-                    'aborted': 'Aborted',
-                    'notbuilt': 'Not Built'
-                }
-                
-                # Handle colors with _anime suffix (running jobs)
-                if color and '_anime' in color:
-                    status = f"{status_map.get(color.replace('_anime', ''), 'Unknown')} (Running)"
-                else:
-                    status = status_map.get(color, 'Unknown')
-                
-                job_data.append([name, status])
+                # Basic status from color (includes _anime variants for running jobs)
+                job_data.append([name, _STATUS_MAP.get(color, 'Unknown')])
         else:
-            # Detailed mode - get full status for each job
-            for job in filtered_jobs:
-                name = job['name']
-                job_path = get_job_path(name)
-                
-                # Try to get more detailed job info
-                try:
-                    job_info = server.get_job_info(job_path)
-                    is_job_folder = is_folder(job_info)
-                    
+            # Detailed mode - fetch full status for all jobs concurrently
+            from concurrent.futures import ThreadPoolExecutor
+            server = get_jenkins_client()
+            with ThreadPoolExecutor(max_workers=JOB_STATUS_WORKERS) as executor:
+                results = executor.map(lambda job: get_job_status(server, job['name']), filtered_jobs)
+                for job, status in zip(filtered_jobs, results):
                     # Skip folders if not showing all
-                    if is_job_folder and not all:
+                    if status == "Folder" and not all:
                         continue
-                    
-                    # Get job status
-                    if is_job_folder:
-                        status = "Folder"
-                    else:
-                        # Get last build info if available
-                        if job_info.get('lastBuild'):
-                            last_build = job_info['lastBuild']
-                            build_number = last_build.get('number', 'N/A')
-                            
-                            # Try to get build status
-                            try:
-                                build_info = server.get_build_info(job_path, build_number)
-                                if build_info.get('building'):
-                                    status = "Building"
-                                else:
-                                    status = build_info.get('result', 'Unknown')
-                            except:
-                                status = "Unknown"
-                        else:
-                            status = "Not Built"
-                    
-                    job_data.append([name, status])
-                except Exception as e:
-                    job_data.append([name, "Error"])
+                    job_data.append([job['name'], status])
         
-        click.echo(tabulate(job_data, headers=["Job Name", "Status"], tablefmt="grid"))
+        click.echo(_tabulate(job_data, headers=["Job Name", "Status"], tablefmt="grid"))
     
     except Exception as e:
         click.echo(f"Error listing jobs: {e}")
@@ -503,7 +977,8 @@ def services(filter, format):
     
     if filter:
         filter_lower = filter.lower()
-        filtered_services = [service for service in AVAILABLE_SERVICES if filter_lower in service.lower()]
+        filtered_services = [service for service, service_lower in zip(AVAILABLE_SERVICES, _AVAILABLE_SERVICES_LOWER)
+                             if filter_lower in service_lower]
     
     if not filtered_services:
         click.echo(f"No services found matching '{filter}'")
@@ -515,7 +990,7 @@ def services(filter, format):
         for i, service in enumerate(filtered_services, 1):
             table_data.append([i, service])
         
-        click.echo(tabulate(table_data, headers=["#", "Service Name"], tablefmt="grid"))
+        click.echo(_tabulate(table_data, headers=["#", "Service Name"], tablefmt="grid"))
     else:
         # Simple list format
         click.echo("Available services:")
@@ -554,7 +1029,7 @@ def branches(filter, format):
         for i, branch in enumerate(filtered_branches, 1):
             table_data.append([i, branch])
         
-        click.echo(tabulate(table_data, headers=headers, tablefmt='grid'))
+        click.echo(_tabulate(table_data, headers=headers, tablefmt='grid'))
     else:
         # Simple list format
         click.echo("Cached branches:")
@@ -572,7 +1047,12 @@ def branches(filter, format):
 def cache(clear, clear_branches, info):
     """Manage job and branch caches"""
     if clear:
+        _reset_jobs_cache()
         try:
+            if os.path.exists(CACHE_META_FILE):
+                os.remove(CACHE_META_FILE)
+            if os.path.exists(PARAMS_CACHE_FILE):
+                os.remove(PARAMS_CACHE_FILE)
             if os.path.exists(CACHE_FILE):
                 os.remove(CACHE_FILE)
                 click.echo("Job cache cleared successfully.")
@@ -582,6 +1062,8 @@ def cache(clear, clear_branches, info):
             click.echo(f"Error clearing job cache: {e}")
     
     elif clear_branches:
+        _reset_branch_cache()
+        get_available_branches.cache_clear()
         try:
             if os.path.exists(BRANCH_CACHE_FILE):
                 os.remove(BRANCH_CACHE_FILE)
@@ -595,12 +1077,23 @@ def cache(clear, clear_branches, info):
         try:
             # Job cache info
             if os.path.exists(CACHE_FILE):
-                with open(CACHE_FILE, 'r') as f:
-                    cache_data = json.load(f)
+                # Read the small metadata file; only parse the full cache if it's missing
+                try:
+                    cache_meta = _read_json_file(CACHE_META_FILE)
+                    cache_timestamp = cache_meta['timestamp']
+                    jobs_count = cache_meta['count']
+                except (OSError, ValueError, KeyError):
+                    cache_data = _read_json_file(CACHE_FILE)
+                    cache_timestamp = cache_data['timestamp']
+                    jobs_count = len(cache_data.get('jobs', []))
                 
-                cache_time = datetime.fromisoformat(cache_data['timestamp'])
+                # Caches written before the switch to epoch seconds store an ISO timestamp
+                legacy_format = isinstance(cache_timestamp, str)
+                if legacy_format:
+                    cache_time = datetime.fromisoformat(cache_timestamp)
+                else:
+                    cache_time = datetime.fromtimestamp(cache_timestamp)
                 age = datetime.now() - cache_time
-                jobs_count = len(cache_data.get('jobs', []))
                 
                 click.echo("=== Job Cache ===")
                 click.echo(f"Cache file: {CACHE_FILE}")
@@ -610,7 +1103,10 @@ def cache(clear, clear_branches, info):
                 cache_hours = CACHE_DURATION_MINUTES // 60
                 click.echo(f"Cache duration: {cache_hours} hours")
                 
-                if age > timedelta(minutes=CACHE_DURATION_MINUTES):
+                if legacy_format:
+                    # load_jobs_cache never serves the old format, so it is refreshed on next use
+                    click.echo("Status: EXPIRED (old cache format)")
+                elif age > timedelta(minutes=CACHE_DURATION_MINUTES):
                     click.echo("Status: EXPIRED")
                 else:
                     remaining = timedelta(minutes=CACHE_DURATION_MINUTES) - age
@@ -627,10 +1123,7 @@ def cache(clear, clear_branches, info):
             # Branch cache info
             click.echo("\n=== Branch Cache ===")
             if os.path.exists(BRANCH_CACHE_FILE):
-                with open(BRANCH_CACHE_FILE, 'r') as f:
-                    branch_cache_data = json.load(f)
-                
-                branches = branch_cache_data.get('branches', [])
+                branches = get_cached_branches()
                 click.echo(f"Cache file: {BRANCH_CACHE_FILE}")
                 click.echo(f"Branches cached: {len(branches)}")
                 
@@ -671,9 +1164,6 @@ def scale(partial_service_name, ttl, wait):
             click.echo(f"Error: Scale job '{scale_job_name}' not found.")
             return
         
-        # Get job info to check parameters
-        job_info = server.get_job_info(job_path)
-        
         # Find the best matching service name
         matched_service = find_matching_service(partial_service_name, AVAILABLE_SERVICES)
         
@@ -716,16 +1206,13 @@ def scale(partial_service_name, ttl, wait):
         
         if wait:
             click.echo("Waiting for job to complete...")
-            # Wait for job to start
-            time.sleep(5)
-            
-            # Get build number
-            job_info = server.get_job_info(job_path)
-            if job_info.get('lastBuild'):
-                build_number = job_info['lastBuild'].get('number')
-                if build_number:
-                    result = wait_for_build_to_finish(server, scale_job_name, build_number)
-                    click.echo(f"Job completed with result: {result}")
+            # Wait for the queued job to start and get its build number
+            build_number = wait_for_queued_build(queue_id)
+            if build_number:
+                result = wait_for_build_to_finish(server, scale_job_name, build_number)
+                click.echo(f"Job completed with result: {result}")
+            else:
+                click.echo("Could not determine build number to wait for.")
     
     except Exception as e:
         click.echo(f"Error running scale up job: {e}")
@@ -742,13 +1229,7 @@ def build(partial_service_name, quality, branch, wait, debug):
     
     try:
         # Get jobs from cache or Jenkins API
-        jobs = get_jobs()
-        
-        # Find all build jobs
-        build_jobs = []
-        for job in jobs:
-            if 'build' in job['name'].lower() and not job['name'].lower().endswith('-report'):
-                build_jobs.append(job)
+        build_jobs = get_build_jobs_index()
         
         if not build_jobs:
             click.echo("No build jobs found.")
@@ -757,67 +1238,44 @@ def build(partial_service_name, quality, branch, wait, debug):
         # Use the input job name as-is (no cleaning)
         search_name = partial_service_name.lower()
             
-        # Find matching job
-        matching_jobs = []
-        for job in build_jobs:
-            job_name = job['name'].lower()
-                
-            if search_name in job_name:
-                matching_jobs.append(job)
+        # Find matching jobs, bucketed by match quality. Jobs starting with
+        # "test-collateral-{search_name}" (like "test-collateral-collateral-api-build")
+        # rank above other jobs starting with the partial name.
+        exact_job = get_job_by_name(search_name)
+        if exact_job and exact_job['_is_build']:
+            # Fast path: a full job name needs no scan
+            buckets = ([exact_job], [], [], [])
+            if debug:
+                click.echo("Debug: Using exact match")
+        else:
+            buckets = match_jobs(search_name, build_jobs, preferred_prefix="test-collateral-")
+        match_count = sum(len(bucket) for bucket in buckets)
                 
-        # If no exact match but we have partial matches
-        if not matching_jobs:
+        if not match_count:
             click.echo(f"Error: No build job matching '{partial_service_name}' found.")
             click.echo("Available build jobs:")
-            for job in build_jobs:
+            for _, job in build_jobs:
                 job_name = job['name']
                 click.echo(f"  - {job_name}")
             return
             
         # Debug: Show all matching jobs
-        if debug and len(matching_jobs) > 1:
-            click.echo(f"Debug: Found {len(matching_jobs)} matching jobs:")
-            for job in matching_jobs:
-                click.echo(f"Debug:   - {job['name']}")
-        
-        # If we have multiple matches, find the best one
-        if len(matching_jobs) > 1:
-            # First, check for exact matches
-            exact_matches = []
-            for job in matching_jobs:
-                job_name = job['name'].lower()
-                if job_name == search_name:
-                    exact_matches.append(job)
-                    
-            if exact_matches:
-                matching_jobs = exact_matches
-                if debug:
-                    click.echo(f"Debug: Using exact match")
-            else:
-                # Check for jobs that start with "test-collateral-{search_name}"
-                # This gives priority to jobs like "test-collateral-collateral-api-build"
-                prefix_matches = []
-                for job in matching_jobs:
-                    job_name = job['name'].lower()
-                    if job_name.startswith(f"test-collateral-{search_name}"):
-                        prefix_matches.append(job)
-                        
-                if prefix_matches:
-                    matching_jobs = prefix_matches
-                    if debug:
-                        click.echo(f"Debug: Using prefix match with 'test-collateral-{search_name}'")
-                else:
-                    # Fallback: Check for jobs that start with the partial name
-                    start_matches = []
-                    for job in matching_jobs:
-                        job_name = job['name'].lower()
-                        if job_name.startswith(search_name):
-                            start_matches.append(job)
-                            
-                    if start_matches:
-                        matching_jobs = start_matches
-                        if debug:
-                            click.echo(f"Debug: Using start match with '{search_name}'")
+        if debug and match_count > 1:
+            click.echo(f"Debug: Found {match_count} matching jobs:")
+            for bucket in buckets:
+                for job in bucket:
+                    click.echo(f"Debug:   - {job['name']}")
+        
+        # Use the best non-empty bucket
+        tier = next(i for i, bucket in enumerate(buckets) if bucket)
+        matching_jobs = buckets[tier]
+        if debug and match_count > 1:
+            if tier == 0:
+                click.echo(f"Debug: Using exact match")
+            elif tier == 1:
+                click.echo(f"Debug: Using prefix match with 'test-collateral-{search_name}'")
+            elif tier == 2:
+                click.echo(f"Debug: Using start match with '{search_name}'")
                     
         # Use the first (or only) matching job
         selected_job = matching_jobs[0]
@@ -827,26 +1285,8 @@ def build(partial_service_name, quality, branch, wait, debug):
         if debug:
             click.echo(f"Debug: Selected job: {build_job_name}")
         
-        # Extract service name from job name by matching against AVAILABLE_SERVICES
-        # Job name format: test-collateral-{service}-build
-        # We need to extract just the {service} part for SERVICENAME parameter
-        service_name = build_job_name
-        
-        # Try to match a service from AVAILABLE_SERVICES in the job name
-        # Sort by length (longest first) to match the most specific service name
-        matched_services = []
-        for available_service in AVAILABLE_SERVICES:
-            # Check if this service appears in the job name
-            # For example: "test-collateral-eurex-build" contains "eurex"
-            if available_service in build_job_name:
-                matched_services.append(available_service)
-        
-        # Use the longest matching service name (most specific)
-        if matched_services:
-            service_name = max(matched_services, key=len)
-        # If no match found in AVAILABLE_SERVICES, fallback to string replacement
-        elif build_job_name.startswith('test-collateral-'):
-            service_name = build_job_name.replace('test-collateral-', '').replace('-build', '')
+        # Extract just the {service} part of the job name for the SERVICENAME parameter
+        service_name = extract_service_name(build_job_name)
         
         # Set up parameters based on the Jenkins UI
         parameters = {
@@ -894,35 +1334,17 @@ def build(partial_service_name, quality, branch, wait, debug):
         # Run the build job
         try:
             # Use direct requests to the Jenkins API
-            jenkins_url = os.getenv("JENKINS_URL")
-            jenkins_user = os.getenv("JENKINS_USER")
-            jenkins_token = os.getenv("JENKINS_TOKEN")
-            
             # Construct the URL for the build with parameters
-            build_url = f"{jenkins_url}/job/{job_path.replace('/', '/job/')}/buildWithParameters"
-            
-            # Set up authentication
-            auth = (jenkins_user, jenkins_token)
+            build_url = f"{get_job_url(job_path)}/buildWithParameters"
             
             if debug:
                 click.echo(f"Debug: Preparing request to {build_url}")
             
-            # Build the URL manually to avoid URL encoding of forward slashes in branch name
-            url_params = []
-            for key, value in parameters.items():
-                # Don't encode the forward slash in GIT_REVISION parameter
-                if key == 'GIT_REVISION':
-                    # Replace spaces with %20 but leave forward slashes as-is
-                    encoded_value = value.replace(' ', '%20')
-                else:
-                    encoded_value = requests.utils.quote(value)
-                url_params.append(f"{key}={encoded_value}")
-            
-            # Construct the final URL
-            full_url = f"{build_url}?{'&'.join(url_params)}"
+            # Build the query string ourselves so forward slashes in the branch name stay unencoded
+            full_url = f"{build_url}?{urlencode(parameters, quote_via=quote, safe='/')}"
             
             # Send the request without parameters (they're already in the URL)
-            response = requests.post(full_url, auth=auth)
+            response = get_http_session().post(full_url, auth=JENKINS_AUTH, timeout=HTTP_TIMEOUT)
             
             # Print the actual URL that was sent
             if debug:
@@ -934,20 +1356,16 @@ def build(partial_service_name, quality, branch, wait, debug):
             # Jenkins might return 201 Created or 302 Found for successful build triggers
             if response.status_code in [201, 302]:
                 # Extract the queue ID from the Location header
-                location = response.headers.get('Location')
-                if location:
-                    queue_id = location.split('/')[-1]
-                else:
-                    queue_id = "unknown"
+                queue_id = get_queue_id(response.headers.get('Location'))
                 
                 if debug:
                     click.echo(f"Debug: Request successful with status code {response.status_code}")
-                    click.echo(f"Debug: Response headers: {dict(response.headers)}")
+                    click.echo("Debug: Response headers: " + ", ".join(f"{k}={v}" for k, v in response.headers.items()))
             else:
                 if debug:
                     click.echo(f"Debug: Request failed with status code {response.status_code}")
                     click.echo(f"Debug: Response: {response.text}")
-                    click.echo(f"Debug: Response headers: {dict(response.headers)}")
+                    click.echo("Debug: Response headers: " + ", ".join(f"{k}={v}" for k, v in response.headers.items()))
                     click.echo(f"Debug: URL: {build_url}")
                     click.echo(f"Debug: Parameters: {parameters}")
                 # Provide more helpful error message for common issues
@@ -969,22 +1387,16 @@ def build(partial_service_name, quality, branch, wait, debug):
                     click.echo(f"Debug: Error with python-jenkins: {e2}")
                 raise e
         
-        # Get build number - simple approach: add 1 to the last build number
+        # Only wait for the queue item to start when we're going to wait for the build anyway;
+        # leaving the queue takes at least the Jenkins quiet period
         build_number = None
         
-        try:
-            # Wait a moment for the build to be queued
-            time.sleep(2)
-            
-            # Get the last build number and add 1
-            job_info = server.get_job_info(job_path)
-            if job_info.get('lastBuild'):
-                last_build_number = job_info['lastBuild'].get('number')
-                if last_build_number:
-                    build_number = last_build_number + 1
-        except Exception:
-            # If we can't get the build number, we'll show "pending"
-            pass
+        if wait and queue_id:
+            try:
+                build_number = wait_for_queued_build(queue_id)
+            except Exception:
+                # If we can't get the build number, we'll show "pending"
+                pass
         
         # Print clean output
         click.echo(f"Build job '{build_job_name}' triggered successfully.")
@@ -992,15 +1404,15 @@ def build(partial_service_name, quality, branch, wait, debug):
             click.echo(f"Build #{build_number}")
         else:
             click.echo("Build #pending")
+            if queue_id:
+                click.echo(f"Queue ID: {queue_id}")
         click.echo(f"Branch: {prefixed_branch}")
         click.echo(f"Quality: {'Enabled' if quality else 'Disabled'}")
         
         if wait:
             click.echo("Waiting for job to complete...")
-            # Wait for job to start
-            time.sleep(5)
             
-            # Use the build number we already calculated
+            # Use the build number we already got from the queue
             if build_number:
                 result = wait_for_build_to_finish(server, build_job_name, build_number)
                 click.echo(f"Job completed with result: {result}")
@@ -1020,17 +1432,9 @@ def build(partial_service_name, quality, branch, wait, debug):
 @click.argument('partial_service_name')
 def job_params(partial_service_name):
     """Show Jenkins job parameters for a service"""
-    server = get_jenkins_client()
-    
     try:
         # Get jobs from cache or Jenkins API
-        jobs = get_jobs()
-        
-        # Find all build jobs
-        build_jobs = []
-        for job in jobs:
-            if 'build' in job['name'].lower() and not job['name'].lower().endswith('-report'):
-                build_jobs.append(job)
+        build_jobs = get_build_jobs_index()
         
         if not build_jobs:
             click.echo("No build jobs found.")
@@ -1039,55 +1443,44 @@ def job_params(partial_service_name):
         # Use the input job name as-is (no cleaning)
         search_name = partial_service_name.lower()
             
-        # Find matching job
-        matching_jobs = []
-        for job in build_jobs:
-            job_name = job['name'].lower()
-                
-            if search_name in job_name:
-                matching_jobs.append(job)
+        # Use the first build job whose name contains the search text
+        selected_job = next((job for name_lower, job in build_jobs if search_name in name_lower), None)
                 
-        if not matching_jobs:
+        if selected_job is None:
             click.echo(f"Error: No build job matching '{partial_service_name}' found.")
             click.echo("Available build jobs:")
-            for job in build_jobs:
+            for _, job in build_jobs:
                 job_name = job['name']
                 click.echo(f"  - {job_name}")
             return
             
-        # Use the first matching job
-        selected_job = matching_jobs[0]
         build_job_name = selected_job['name']
         job_path = get_job_path(build_job_name)
         
-        # Get job info
-        job_info = server.get_job_info(job_path)
-        
-        click.echo(f"Job: {build_job_name}")
-        click.echo(f"Path: {job_path}")
-        click.echo("Parameters:")
-        
-        # Extract parameters
-        if job_info.get('property'):
-            for prop in job_info.get('property', []):
-                if prop.get('_class', '').endswith('ParametersDefinitionProperty'):
-                    for param_def in prop.get('parameterDefinitions', []):
-                        param_name = param_def.get('name')
-                        param_type = param_def.get('type', 'Unknown')
-                        param_default = param_def.get('defaultParameterValue', {}).get('value', 'None')
-                        param_description = param_def.get('description', 'No description')
-                        
-                        click.echo(f"  - {param_name} ({param_type})")
-                        click.echo(f"    Default: {param_default}")
-                        click.echo(f"    Description: {param_description}")
-                        
-                        # Show choices for choice parameters
-                        if param_def.get('choices'):
-                            choices = param_def.get('choices', [])
-                            click.echo(f"    Choices: {', '.join(choices)}")
-                        click.echo()
+        # Get parameter definitions (cached on disk, revalidated with Jenkins)
+        params = get_job_parameters(job_path)
+        
+        # Collect the output and write it with a single echo
+        output = [
+            f"Job: {build_job_name}",
+            f"Path: {job_path}",
+            "Parameters:",
+        ]
+        
+        if params:
+            for param_name, param_type, param_default, param_description, choices in params:
+                output.append(f"  - {param_name} ({param_type})")
+                output.append(f"    Default: {param_default}")
+                output.append(f"    Description: {param_description}")
+                
+                # Show choices for choice parameters
+                if choices:
+                    output.append(f"    Choices: {', '.join(choices)}")
+                output.append("")
         else:
-            click.echo("  No parameters defined for this job.")
+            output.append("  No parameters defined for this job.")
+        
+        click.echo("\n".join(output))
     
     except Exception as e:
         click.echo(f"Error getting job parameters: {e}")
@@ -1151,16 +1544,13 @@ def deploy(partial_service_name, build_number, wait):
         
         if wait:
             click.echo("Waiting for job to complete...")
-            # Wait for job to start
-            time.sleep(5)
-            
-            # Get build number
-            job_info = server.get_job_info(job_path)
-            if job_info.get('lastBuild'):
-                job_build_number = job_info['lastBuild'].get('number')
-                if job_build_number:
-                    result = wait_for_build_to_finish(server, deploy_job_name, job_build_number)
-                    click.echo(f"Job completed with result: {result}")
+            # Wait for the queued job to start and get its build number
+            job_build_number = wait_for_queued_build(queue_id)
+            if job_build_number:
+                result = wait_for_build_to_finish(server, deploy_job_name, job_build_number)
+                click.echo(f"Job completed with result: {result}")
+            else:
+                click.echo("Could not determine build number to wait for.")
     
     except Exception as e:
         click.echo(f"Error running deploy job: {e}")
@@ -1178,48 +1568,26 @@ def status(partial_service_name, build_number, wait):
     
     try:
         # Get jobs from cache or Jenkins API
-        jobs = get_jobs()
+        jobs_index = get_jobs_index()
         
         # Use the input job name as-is (no cleaning)
         search_name = partial_service_name.lower()
             
-        # Find matching jobs
-        matching_jobs = []
-        for job in jobs:
-            job_name = job['name'].lower()
-                
-            if search_name in job_name:
-                matching_jobs.append(job)
+        # Find matching jobs; a full job name is a single dict lookup, otherwise
+        # the best non-empty bucket is exact, then prefix, then substring matches
+        exact_job = get_job_by_name(search_name)
+        if exact_job:
+            matching_jobs = [exact_job]
+        else:
+            matching_jobs = next((bucket for bucket in match_jobs(search_name, jobs_index) if bucket), None)
                 
         if not matching_jobs:
             click.echo(f"Error: No job matching '{partial_service_name}' found.")
             click.echo("Available jobs:")
-            for job in jobs:
+            for _, job in jobs_index:
                 job_name = job['name']
                 click.echo(f"  - {job_name}")
             return
-            
-        # If we have multiple matches, find the best one
-        if len(matching_jobs) > 1:
-            # First, check for exact matches
-            exact_matches = []
-            for job in matching_jobs:
-                job_name = job['name'].lower()
-                if job_name == search_name:
-                    exact_matches.append(job)
-                    
-            if exact_matches:
-                matching_jobs = exact_matches
-            else:
-                # Check for jobs that start with the partial name
-                start_matches = []
-                for job in matching_jobs:
-                    job_name = job['name'].lower()
-                    if job_name.startswith(search_name):
-                        start_matches.append(job)
-                        
-                if start_matches:
-                    matching_jobs = start_matches
                     
         # Use the first (or only) matching job
         selected_job = matching_jobs[0]
@@ -1237,22 +1605,20 @@ def status(partial_service_name, build_number, wait):
             click.echo(f"Error: Job '{job_name}' not found in {BASE_FOLDER} folder.")
             return
         
-        job_info = server.get_job_info(job_path)
+        job_info = get_job_tree(job_path, '_class,lastBuild[number]')
         
         if is_folder(job_info):
             click.echo(f"Error: '{job_name}' is a folder, not a job.")
             return
         
-        if not job_info.get('builds'):
+        # A job without a last build has no builds at all
+        last_build = job_info.get('lastBuild')
+        if not last_build:
             click.echo(f"Job '{job_name}' has no builds yet.")
             return
         
         # If build number not provided, use the latest build
         if not build_number:
-            last_build = job_info.get('lastBuild', {})
-            if not last_build:
-                click.echo(f"Job '{job_name}' has no builds yet.")
-                return
                 
             build_number = last_build.get('number')
             if not build_number:
@@ -1263,27 +1629,28 @@ def status(partial_service_name, build_number, wait):
         build_info = server.get_build_info(job_path, int(build_number))
         
         # Format timestamp
-        from datetime import datetime
         timestamp = build_info.get('timestamp', 0)
         build_time = datetime.fromtimestamp(timestamp/1000).strftime('%Y-%m-%d %H:%M:%S')
         
-        # Display build information
-        click.echo(f"Job: {job_name}")
-        click.echo(f"Build: #{build_number}")
+        # Display build information (collected and written with a single echo)
+        output = [
+            f"Job: {job_name}",
+            f"Build: #{build_number}",
+        ]
         
         is_building = build_info.get('building', False)
         result = build_info.get('result') if not is_building else "BUILDING"
         
-        click.echo(f"Status: {result}")
-        click.echo(f"Started: {build_time}")
+        output.append(f"Status: {result}")
+        output.append(f"Started: {build_time}")
         
         if is_building:
             elapsed = (datetime.now().timestamp() * 1000 - timestamp) / 1000
-            click.echo(f"Running for: {elapsed:.2f} seconds")
+            output.append(f"Running for: {elapsed:.2f} seconds")
         else:
-            click.echo(f"Duration: {build_info.get('duration', 0)/1000:.2f} seconds")
+            output.append(f"Duration: {build_info.get('duration', 0)/1000:.2f} seconds")
         
-        click.echo(f"URL: {build_info.get('url', 'N/A')}")
+        output.append(f"URL: {build_info.get('url', 'N/A')}")
         
         # Show parameters if any
         actions = build_info.get('actions', [])
@@ -1291,11 +1658,13 @@ def status(partial_service_name, build_number, wait):
             if action.get('_class', '').endswith('ParametersAction'):
                 parameters = action.get('parameters', [])
                 if parameters:
-                    click.echo("\nParameters:")
+                    output.append("\nParameters:")
                     for param in parameters:
                         name = param.get('name', 'Unknown')
                         value = param.get('value', 'N/A')
-                        click.echo(f"  {name}: {value}")
+                        output.append(f"  {name}: {value}")
+        
+        click.echo("\n".join(output))
         
         # Wait for build to finish if requested and still running
         if wait and is_building:
@@ -1318,48 +1687,26 @@ def console(partial_service_name, build_number, tail, lines, follow):
     
     try:
         # Get jobs from cache or Jenkins API
-        jobs = get_jobs()
+        jobs_index = get_jobs_index()
         
         # Use the input job name as-is (no cleaning)
         search_name = partial_service_name.lower()
             
-        # Find matching jobs
-        matching_jobs = []
-        for job in jobs:
-            job_name = job['name'].lower()
-                
-            if search_name in job_name:
-                matching_jobs.append(job)
+        # Find matching jobs; a full job name is a single dict lookup, otherwise
+        # the best non-empty bucket is exact, then prefix, then substring matches
+        exact_job = get_job_by_name(search_name)
+        if exact_job:
+            matching_jobs = [exact_job]
+        else:
+            matching_jobs = next((bucket for bucket in match_jobs(search_name, jobs_index) if bucket), None)
                 
         if not matching_jobs:
             click.echo(f"Error: No job matching '{partial_service_name}' found.")
             click.echo("Available jobs:")
-            for job in jobs:
+            for _, job in jobs_index:
                 job_name = job['name']
                 click.echo(f"  - {job_name}")
             return
-            
-        # If we have multiple matches, find the best one
-        if len(matching_jobs) > 1:
-            # First, check for exact matches
-            exact_matches = []
-            for job in matching_jobs:
-                job_name = job['name'].lower()
-                if job_name == search_name:
-                    exact_matches.append(job)
-                    
-            if exact_matches:
-                matching_jobs = exact_matches
-            else:
-                # Check for jobs that start with the partial name
-                start_matches = []
-                for job in matching_jobs:
-                    job_name = job['name'].lower()
-                    if job_name.startswith(search_name):
-                        start_matches.append(job)
-                        
-                if start_matches:
-                    matching_jobs = start_matches
                     
         # Use the first (or only) matching job
         selected_job = matching_jobs[0]
@@ -1377,7 +1724,7 @@ def console(partial_service_name, build_number, tail, lines, follow):
             click.echo(f"Error: Job '{job_name}' not found in {BASE_FOLDER} folder.")
             return
         
-        job_info = server.get_job_info(job_path)
+        job_info = get_job_tree(job_path, '_class,lastBuild[number]')
         
         if is_folder(job_info):
             click.echo(f"Error: '{job_name}' is a folder, not a job.")
@@ -1385,12 +1732,8 @@ def console(partial_service_name, build_number, tail, lines, follow):
         
         # If build number not provided, use the latest build
         if not build_number:
-            if not job_info.get('builds'):
-                click.echo(f"Job '{job_name}' has no builds yet.")
-                return
-                
             if not job_info.get('lastBuild'):
-                click.echo(f"Job '{job_name}' has no last build information.")
+                click.echo(f"Job '{job_name}' has no builds yet.")
                 return
                 
             build_number = job_info['lastBuild'].get('number')
@@ -1400,58 +1743,70 @@ def console(partial_service_name, build_number, tail, lines, follow):
         else:
             build_number = int(build_number)
         
-        # Get initial console output
-        console_output = server.get_build_console_output(job_path, build_number)
-        
         if follow:
-            # Get build info to check if it's still running
-            build_info = server.get_build_info(job_path, build_number)
-            is_building = build_info.get('building', False)
-            
-            # Show initial output
-            if tail and console_output:
-                console_lines = console_output.splitlines()
-                if len(console_lines) > lines:
-                    console_output = "\n".join(console_lines[-lines:])
-            
             click.echo(f"Console output for {job_name} #{build_number}:")
             click.echo("=" * 80)
-            click.echo(console_output)
             
-            # If the job is still running, follow the output
-            last_size = len(console_output)
-            while is_building:
-                time.sleep(2)
-                
-                # Get updated console output
-                new_output = server.get_build_console_output(job_path, build_number)
+            # Fetch only the new part of the log on each poll; Jenkins reports the
+            # next offset in X-Text-Size and sets X-More-Data while the build runs
+            session = get_http_session()
+            log_url = f"{get_job_url(job_path)}/{build_number}/logText/progressiveText"
+            start = 0
+            interval = 0.25
+            while True:
+                response = session.get(log_url, params={'start': start}, timeout=HTTP_TIMEOUT)
+                response.raise_for_status()
+                new_output = response.text
                 
-                # If there's new content, print it
-                if len(new_output) > last_size:
-                    click.echo(new_output[last_size:], nl=False)
-                    last_size = len(new_output)
+                # Print nothing while the log is still empty (start stays 0 until output arrives)
+                if new_output and start == 0:
+                    # Show initial output (trimmed to the last lines if requested)
+                    if tail:
+                        console_lines = new_output.splitlines()
+                        if len(console_lines) > lines:
+                            new_output = "\n".join(console_lines[-lines:])
+                    click.echo(new_output)
+                elif new_output:
+                    click.echo(new_output, nl=False)
                 
-                # Check if job is still running
-                build_info = server.get_build_info(job_path, build_number)
-                is_building = build_info.get('building', False)
+                start = int(response.headers.get('X-Text-Size', start + len(response.content)))
+                if response.headers.get('X-More-Data') != 'true':
+                    break
+                # Poll again quickly while output is flowing, back off up to 2s when idle
+                interval = 0.25 if new_output else min(interval * 1.5, 2)
+                time.sleep(interval)
             
             # Show final status
+            build_info = server.get_build_info(job_path, build_number)
             result = build_info.get('result', 'UNKNOWN')
             click.echo(f"\nJob completed with result: {result}")
         else:
-            # Just show the console output once
-            if tail and console_output:
-                console_lines = console_output.splitlines()
-                if len(console_lines) > lines:
-                    console_output = "\n".join(console_lines[-lines:])
-                    click.echo(f"Console output for {job_name} #{build_number} (last {lines} lines):")
+            # Just show the console output once, streamed so the whole log is never held in memory
+            log_url = f"{get_job_url(job_path)}/{build_number}/consoleText"
+            with get_http_session().get(log_url, stream=True, timeout=HTTP_TIMEOUT) as response:
+                response.raise_for_status()
+                # Decode as UTF-8 (Jenkins' log encoding) if the server didn't name a charset
+                response.encoding = response.encoding or 'utf-8'
+                if tail:
+                    # Keep only the last lines while counting the rest
+                    line_count = 0
+                    console_lines = deque(maxlen=lines)
+                    for line in response.iter_lines(decode_unicode=True):
+                        console_lines.append(line)
+                        line_count += 1
+                    
+                    if line_count > lines:
+                        click.echo(f"Console output for {job_name} #{build_number} (last {lines} lines):")
+                    else:
+                        click.echo(f"Console output for {job_name} #{build_number}:")
+                    click.echo("=" * 80)
+                    click.echo("\n".join(console_lines))
                 else:
                     click.echo(f"Console output for {job_name} #{build_number}:")
-            else:
-                click.echo(f"Console output for {job_name} #{build_number}:")
-                
-            click.echo("=" * 80)
-            click.echo(console_output)
+                    click.echo("=" * 80)
+                    for chunk in response.iter_content(chunk_size=65536, decode_unicode=True):
+                        click.echo(chunk, nl=False)
+                    click.echo()
     
     except Exception as e:
         click.echo(f"Error retrieving console output: {e}")
@@ -1509,7 +1864,9 @@ def ship(partial_service_name, ttl, quality, branch, skip_scale, skip_deploy, de
     click.echo("=" * 80)
     
     build_number = None
+    build_queue_id = None
     scale_build_number = None
+    scale_queue_id = None
     scale_job_name = None
     build_job_name = None
     
@@ -1545,14 +1902,7 @@ def ship(partial_service_name, ttl, quality, branch, skip_scale, skip_deploy, de
                 click.echo(f"✓ Scale up job triggered")
                 click.echo(f"  Queue ID: {scale_queue_id}")
                 click.echo(f"  Time to live: {ttl} hours")
-                
-                # Wait a moment and get the build number
-                time.sleep(3)
-                scale_job_info = server.get_job_info(scale_job_path)
-                if scale_job_info.get('lastBuild'):
-                    scale_build_number = scale_job_info['lastBuild'].get('number')
-                    if scale_build_number:
-                        click.echo(f"  Build #{scale_build_number}")
+                # The build number is picked up from the queue while waiting below
         else:
             click.echo("\n[Job 1/2] Scale Up - SKIPPED")
         
@@ -1562,13 +1912,7 @@ def ship(partial_service_name, ttl, quality, branch, skip_scale, skip_deploy, de
         click.echo("\n[Job 2/2] Starting Build...")
         
         # Get jobs from cache or Jenkins API
-        jobs = get_jobs()
-        
-        # Find all build jobs
-        build_jobs = []
-        for job in jobs:
-            if 'build' in job['name'].lower() and not job['name'].lower().endswith('-report'):
-                build_jobs.append(job)
+        build_jobs = get_build_jobs_index()
         
         if not build_jobs:
             click.echo("Error: No build jobs found.")
@@ -1577,46 +1921,17 @@ def ship(partial_service_name, ttl, quality, branch, skip_scale, skip_deploy, de
         # Use the input job name as-is (no cleaning)
         search_name = partial_service_name.lower()
             
-        # Find matching job
-        matching_jobs = []
-        for job in build_jobs:
-            job_name = job['name'].lower()
-                
-            if search_name in job_name:
-                matching_jobs.append(job)
+        # Find matching job: a full job name needs no scan, otherwise prefer the best non-empty bucket
+        exact_job = get_job_by_name(search_name)
+        if exact_job and exact_job['_is_build']:
+            matching_jobs = [exact_job]
+        else:
+            buckets = match_jobs(search_name, build_jobs, preferred_prefix="test-collateral-")
+            matching_jobs = next((bucket for bucket in buckets if bucket), None)
                 
         if not matching_jobs:
             click.echo(f"Error: No build job matching '{partial_service_name}' found.")
             return
-            
-        # If we have multiple matches, find the best one
-        if len(matching_jobs) > 1:
-            exact_matches = []
-            for job in matching_jobs:
-                job_name = job['name'].lower()
-                if job_name == search_name:
-                    exact_matches.append(job)
-                    
-            if exact_matches:
-                matching_jobs = exact_matches
-            else:
-                prefix_matches = []
-                for job in matching_jobs:
-                    job_name = job['name'].lower()
-                    if job_name.startswith(f"test-collateral-{search_name}"):
-                        prefix_matches.append(job)
-                        
-                if prefix_matches:
-                    matching_jobs = prefix_matches
-                else:
-                    start_matches = []
-                    for job in matching_jobs:
-                        job_name = job['name'].lower()
-                        if job_name.startswith(search_name):
-                            start_matches.append(job)
-                            
-                    if start_matches:
-                        matching_jobs = start_matches
         
         selected_job = matching_jobs[0]
         build_job_name = selected_job['name']
@@ -1626,16 +1941,7 @@ def ship(partial_service_name, ttl, quality, branch, skip_scale, skip_deploy, de
             click.echo(f"Debug: Selected build job: {build_job_name}")
         
         # Extract service name from job name
-        build_service_name = build_job_name
-        matched_services = []
-        for available_service in AVAILABLE_SERVICES:
-            if available_service in build_job_name:
-                matched_services.append(available_service)
-        
-        if matched_services:
-            build_service_name = max(matched_services, key=len)
-        elif build_job_name.startswith('test-collateral-'):
-            build_service_name = build_job_name.replace('test-collateral-', '').replace('-build', '')
+        build_service_name = extract_service_name(build_job_name)
         
         # Set up build parameters
         build_parameters = {
@@ -1666,42 +1972,20 @@ def ship(partial_service_name, ttl, quality, branch, skip_scale, skip_deploy, de
         
         # Trigger build
         try:
-            jenkins_url = os.getenv("JENKINS_URL")
-            jenkins_user = os.getenv("JENKINS_USER")
-            jenkins_token = os.getenv("JENKINS_TOKEN")
-            
-            build_url = f"{jenkins_url}/job/{build_job_path.replace('/', '/job/')}/buildWithParameters"
-            auth = (jenkins_user, jenkins_token)
-            
-            url_params = []
-            for key, value in build_parameters.items():
-                if key == 'GIT_REVISION':
-                    encoded_value = value.replace(' ', '%20')
-                else:
-                    encoded_value = requests.utils.quote(value)
-                url_params.append(f"{key}={encoded_value}")
-            
-            full_url = f"{build_url}?{'&'.join(url_params)}"
-            response = requests.post(full_url, auth=auth)
+            build_url = f"{get_job_url(build_job_path)}/buildWithParameters"
+            full_url = f"{build_url}?{urlencode(build_parameters, quote_via=quote, safe='/')}"
+            response = get_http_session().post(full_url, auth=JENKINS_AUTH, timeout=HTTP_TIMEOUT)
             
             if response.status_code not in [201, 302]:
                 raise Exception(f"Failed to trigger build: {response.status_code} {response.reason}")
             
-            # Get build number
-            time.sleep(3)
-            build_job_info = server.get_job_info(build_job_path)
-            if build_job_info.get('lastBuild'):
-                last_build_number = build_job_info['lastBuild'].get('number')
-                if last_build_number:
-                    build_number = last_build_number + 1
+            build_queue_id = get_queue_id(response.headers.get('Location'))
             
             click.echo(f"✓ Build job '{build_job_name}' triggered")
-            if build_number:
-                click.echo(f"  Build #{build_number}")
-            else:
-                click.echo("  Build #pending")
+            click.echo(f"  Queue ID: {build_queue_id}")
             click.echo(f"  Branch: {prefixed_branch}")
             click.echo(f"  Quality: {'Enabled' if quality else 'Disabled'}")
+            # The build number is picked up from the queue while waiting below
         
         except Exception as e:
             click.echo(f"Error during build trigger: {e}")
@@ -1729,49 +2013,82 @@ def ship(partial_service_name, ttl, quality, branch, skip_scale, skip_deploy, de
         max_wait_time = 3600  # 1 hour max
         start_time = time.time()
         
-        while (not scale_complete or not build_complete) and (time.time() - start_time < max_wait_time):
-            # Check scale up status
-            if not scale_complete and scale_build_number and scale_job_name:
-                try:
-                    scale_build_info = server.get_build_info(get_job_path(scale_job_name), scale_build_number)
-                    if not scale_build_info.get('building'):
-                        scale_complete = True
-                        scale_result = scale_build_info.get('result', 'UNKNOWN')
-                        elapsed = int(time.time() - start_time)
-                        click.echo(f"\n✓ Scale up completed with result: {scale_result} (after {elapsed}s)")
-                except Exception as e:
-                    if debug:
-                        click.echo(f"Debug: Error checking scale up status: {e}")
-            
-            # Check build status
-            if not build_complete and build_number and build_job_name:
-                try:
-                    build_build_info = server.get_build_info(get_job_path(build_job_name), build_number)
-                    if not build_build_info.get('building'):
-                        build_complete = True
-                        build_result = build_build_info.get('result', 'UNKNOWN')
-                        elapsed = int(time.time() - start_time)
-                        click.echo(f"\n✓ Build completed with result: {build_result} (after {elapsed}s)")
-                except Exception as e:
-                    if debug:
-                        click.echo(f"Debug: Error checking build status: {e}")
-            
-            # If both are complete, break
-            if scale_complete and build_complete:
-                break
-            
-            # Show progress
-            elapsed = int(time.time() - start_time)
-            status_parts = []
-            if not scale_complete:
-                status_parts.append("Scale up running")
-            if not build_complete:
-                status_parts.append("Build running")
-            
-            click.echo(f"⏳ {', '.join(status_parts)}... (elapsed: {elapsed}s)", nl=False)
-            click.echo('\r', nl=False)  # Carriage return to overwrite line
-            
-            time.sleep(poll_interval)
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            while (not scale_complete or not build_complete) and (time.time() - start_time < max_wait_time):
+                # Jobs still waiting in the queue get their build number once they start
+                if not scale_build_number and scale_queue_id:
+                    try:
+                        queue_item = get_queue_item(scale_queue_id)
+                        if queue_item.get('executable'):
+                            scale_build_number = queue_item['executable'].get('number')
+                            click.echo(f"\n✓ Scale up started: Build #{scale_build_number}")
+                    except Exception as e:
+                        if debug:
+                            click.echo(f"Debug: Error checking scale up queue item: {e}")
+                
+                if not build_number and build_queue_id:
+                    try:
+                        queue_item = get_queue_item(build_queue_id)
+                        if queue_item.get('executable'):
+                            build_number = queue_item['executable'].get('number')
+                            click.echo(f"\n✓ Build started: Build #{build_number}")
+                    except Exception as e:
+                        if debug:
+                            click.echo(f"Debug: Error checking build queue item: {e}")
+                
+                # Poll the scale up and build status concurrently
+                scale_future = None
+                build_future = None
+                if not scale_complete and scale_build_number and scale_job_name:
+                    scale_future = executor.submit(get_job_tree, get_job_path(scale_job_name),
+                                                   'building,result', scale_build_number)
+                if not build_complete and build_number and build_job_name:
+                    build_future = executor.submit(get_job_tree, get_job_path(build_job_name),
+                                                   'building,result', build_number)
+                
+                # Check scale up status
+                if scale_future:
+                    try:
+                        scale_build_info = scale_future.result()
+                        if not scale_build_info.get('building'):
+                            scale_complete = True
+                            scale_result = scale_build_info.get('result', 'UNKNOWN')
+                            elapsed = int(time.time() - start_time)
+                            click.echo(f"\n✓ Scale up completed with result: {scale_result} (after {elapsed}s)")
+                    except Exception as e:
+                        if debug:
+                            click.echo(f"Debug: Error checking scale up status: {e}")
+                
+                # Check build status
+                if build_future:
+                    try:
+                        build_build_info = build_future.result()
+                        if not build_build_info.get('building'):
+                            build_complete = True
+                            build_result = build_build_info.get('result', 'UNKNOWN')
+                            elapsed = int(time.time() - start_time)
+                            click.echo(f"\n✓ Build completed with result: {build_result} (after {elapsed}s)")
+                    except Exception as e:
+                        if debug:
+                            click.echo(f"Debug: Error checking build status: {e}")
+                
+                # If both are complete, break
+                if scale_complete and build_complete:
+                    break
+                
+                # Show progress
+                elapsed = int(time.time() - start_time)
+                status_parts = []
+                if not scale_complete:
+                    status_parts.append("Scale up running")
+                if not build_complete:
+                    status_parts.append("Build running")
+                
+                click.echo(f"⏳ {', '.join(status_parts)}... (elapsed: {elapsed}s)", nl=False)
+                click.echo('\r', nl=False)  # Carriage return to overwrite line
+                
+                time.sleep(poll_interval)
         
         # Clear the progress line
         click.echo(" " * 80, nl=False)
@@ -1813,8 +2130,6 @@ def ship(partial_service_name, ttl, quality, branch, skip_scale, skip_deploy, de
             deploy_job_name = "test-collateral-Deploy-services"
             deploy_job_path = get_job_path(deploy_job_name)
             
-            jenkins_url = os.getenv("JENKINS_URL")
-            
             if not server.job_exists(deploy_job_path):
                 click.echo(f"Error: Deploy job '{deploy_job_name}' not found.")
             else:
@@ -1832,34 +2147,14 @@ def ship(partial_service_name, ttl, quality, branch, skip_scale, skip_deploy, de
                 
                 # Wait for deploy to start and get build number
                 click.echo("  Waiting for deploy job to start...")
-                deploy_build_number = None
                 deploy_start_wait = 60  # Wait up to 60 seconds for job to start
-                deploy_start_time = time.time()
-                
-                while time.time() - deploy_start_time < deploy_start_wait:
-                    time.sleep(3)
-                    try:
-                        deploy_job_info = server.get_job_info(deploy_job_path)
-                        if deploy_job_info.get('lastBuild'):
-                            last_deploy_build = deploy_job_info['lastBuild'].get('number')
-                            # Check if this is a new build (triggered after our queue)
-                            if last_deploy_build:
-                                # Verify this build matches our parameters
-                                deploy_build_info = server.get_build_info(deploy_job_path, last_deploy_build)
-                                # Check if build is recent (started in last 2 minutes)
-                                deploy_timestamp = deploy_build_info.get('timestamp', 0)
-                                current_time_ms = time.time() * 1000
-                                if deploy_timestamp and (current_time_ms - deploy_timestamp < 120000):  # 2 minutes
-                                    deploy_build_number = last_deploy_build
-                                    click.echo(f"  Deploy job started: Build #{deploy_build_number}")
-                                    break
-                    except Exception as e:
-                        if debug:
-                            click.echo(f"Debug: Error getting deploy build number: {e}")
+                deploy_build_number = wait_for_queued_build(deploy_queue_id, timeout=deploy_start_wait)
+                if deploy_build_number:
+                    click.echo(f"  Deploy job started: Build #{deploy_build_number}")
                 
                 if not deploy_build_number:
                     click.echo("  ⚠ Could not determine deploy build number within timeout")
-                    click.echo(f"  Please check deploy job manually at: {jenkins_url}/job/{deploy_job_path.replace('/', '/job/')}")
+                    click.echo(f"  Please check deploy job manually at: {get_job_url(deploy_job_path)}")
                     click.echo("  The deploy job may still be queued or starting...")
                 else:
                     # Monitor deploy job until completion
@@ -1872,7 +2167,7 @@ def ship(partial_service_name, ttl, quality, branch, skip_scale, skip_deploy, de
                     deploy_result = None
                     while time.time() - deploy_wait_start < deploy_max_wait:
                         try:
-                            deploy_build_info = server.get_build_info(deploy_job_path, deploy_build_number)
+                            deploy_build_info = get_job_tree(deploy_job_path, 'building,result', deploy_build_number)
                             
                             if not deploy_build_info.get('building'):
                                 # Deploy completed
@@ -11,6 +11,12 @@ setup(
         "tabulate>=0.9.0",
         "requests>=2.25.0",
     ],
+    extras_require={
+        "fast": [
+            "orjson>=3.0.0",
+            "rapidfuzz>=2.0.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "j=jenkins_cli.test_collateral:main",